@@ -1,69 +1,423 @@
 """HTTP/SSE server implementation for MCP Time Server"""
-import asyncio
+import logging
 import os
+from collections.abc import Awaitable, Callable
+from importlib.util import find_spec
 from typing import Any
 
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
-from starlette.applications import Starlette
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.routing import Route, Mount
 
-from .server import TimeServer, TimeTools, get_local_tz
-from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from .server import TOOL_HANDLERS, TimeServer, TimeTools, get_local_tz
+from mcp.types import (
+    EmbeddedResource,
+    ImageContent,
+    TextContent,
+    Tool,
+)
 from typing import Sequence
-import json
+import orjson
 
+logger = logging.getLogger(__name__)
 
-def create_app(local_timezone: str | None = None) -> Starlette:
-    """Create the Starlette ASGI application"""
+
+# Static response bodies, serialized once at import time
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "server": "mcp-time",
+    "version": "0.6.2",
+    "mcp_endpoint": "/mcp"
+})
+
+_CONFIG_BODY = orjson.dumps({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "$id": "https://mcp-time/.well-known/mcp-config",
+    "title": "MCP Time Server Configuration",
+    "description": "Configuration for MCP Time Server (no configuration required)",
+    "type": "object",
+    "properties": {},
+    "additionalProperties": False
+})
+
+# Notifications acknowledged with an empty 202 response
+_ACKNOWLEDGED_NOTIFICATIONS = frozenset(
+    ("notifications/initialized", "notifications/cancelled")
+)
+
+# JSON-RPC envelopes share a fixed prefix; only the id and the result/error
+# payload vary per request
+_ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+# orjson only parses integers in [-2**63, 2**64) exactly and turns larger ones
+# into floats that round to these bounds or beyond, so such ids could not be
+# echoed back unchanged
+_ID_MIN = -(2**63)
+_ID_MAX = 2**64
+
+_INITIALIZE_RESULT = orjson.dumps({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "experimental": {},
+        "tools": {
+            "listChanged": False
+        }
+    },
+    "serverInfo": {
+        "name": "mcp-time",
+        "version": "1.0.0"
+    }
+})
+
+
+def _static_json_messages(body: bytes) -> tuple[dict, dict]:
+    """Build the complete start and body messages for a static JSON response"""
+    start = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"cache-control", b"no-cache"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+# Complete ASGI messages for the static responses, sent as-is without any
+# per-request allocation
+_HEALTH_START, _HEALTH_MESSAGE = _static_json_messages(_HEALTH_BODY)
+_CONFIG_START, _CONFIG_MESSAGE = _static_json_messages(_CONFIG_BODY)
+
+_ACCEPTED_START = {
+    "type": "http.response.start",
+    "status": 202,
+    "headers": [(b"content-length", b"0")],
+}
+_EMPTY_BODY = {"type": "http.response.body", "body": b""}
+
+_NOT_FOUND_START = {
+    "type": "http.response.start",
+    "status": 404,
+    "headers": [(b"content-type", b"text/plain"), (b"content-length", b"9")],
+}
+_NOT_FOUND_BODY = {"type": "http.response.body", "body": b"Not Found"}
+
+_METHOD_NOT_ALLOWED_BODY = {"type": "http.response.body", "body": b"Method Not Allowed"}
+
+
+def _method_not_allowed_start(methods: list[str]) -> dict:
+    """Build the 405 start message for a path that supports the given methods"""
+    return {
+        "type": "http.response.start",
+        "status": 405,
+        "headers": [
+            (b"content-type", b"text/plain"),
+            (b"content-length", b"18"),
+            (b"allow", ", ".join(methods).encode()),
+        ],
+    }
+
+
+async def _send_response(send: Any, status: int, headers: list, body: bytes) -> None:
+    """Send a complete response as a start message immediately followed by its body"""
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _jsonrpc_result(req_id: Any, result: bytes) -> bytes:
+    """Build a JSON-RPC result response around an already serialized result"""
+    return b"".join((_ENVELOPE_PREFIX, orjson.dumps(req_id), b',"result":', result, b"}"))
+
+
+def _jsonrpc_error(req_id: Any, code: int, message: str) -> bytes:
+    """Build a JSON-RPC error response"""
+    error = orjson.dumps({"code": code, "message": message})
+    return b"".join((_ENVELOPE_PREFIX, orjson.dumps(req_id), b',"error":', error, b"}"))
+
+
+async def _send_json(send: Any, status: int, body: bytes) -> None:
+    """Send a serialized JSON body with its content-length"""
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    await _send_response(send, status, headers, body)
+
+
+async def _read_body(receive: Any) -> bytes:
+    """Read the full request body from the ASGI receive channel"""
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+async def _health(scope: dict, receive: Any, send: Any) -> None:
+    """Health check endpoint"""
+    await send(_HEALTH_START)
+    await send(_HEALTH_MESSAGE)
+
+
+async def _config(scope: dict, receive: Any, send: Any) -> None:
+    """MCP configuration endpoint for Smithery discovery"""
+    await send(_CONFIG_START)
+    await send(_CONFIG_MESSAGE)
+
+
+async def _health_head(scope: dict, receive: Any, send: Any) -> None:
+    """Health check headers without the body"""
+    await send(_HEALTH_START)
+    await send(_EMPTY_BODY)
+
+
+async def _config_head(scope: dict, receive: Any, send: Any) -> None:
+    """MCP configuration headers without the body"""
+    await send(_CONFIG_START)
+    await send(_EMPTY_BODY)
+
+
+async def _not_found(scope: dict, receive: Any, send: Any) -> None:
+    """404 Not Found"""
+    logger.debug("Not found: %s %s", scope["method"], scope["path"])
+    await send(_NOT_FOUND_START)
+    await send(_NOT_FOUND_BODY)
+
+
+class _TimeApp:
+    """ASGI application routing requests to the MCP handlers
+
+    Handlers are methods reading their dependencies from slots, so nothing is
+    re-created or looked up through closure cells per request.
+    """
+
+    __slots__ = (
+        "_server",
+        "_init_options",
+        "_sse_transport",
+        "_time_server",
+        "_static_results",
+        "_routes_get",
+        "_not_allowed_get",
+    )
+
+    def __init__(
+        self,
+        server: Server,
+        init_options: Any,
+        sse_transport: SseServerTransport,
+        time_server: TimeServer,
+        static_results: dict[str, bytes],
+    ) -> None:
+        self._server = server
+        self._init_options = init_options
+        self._sse_transport = sse_transport
+        self._time_server = time_server
+        self._static_results = static_results
+
+        # (raw path, method) -> handler, so routing is a single dict lookup on
+        # the undecoded request path
+        routes = {
+            # SSE connection
+            (b"/mcp", "GET"): self._handle_mcp_sse,
+            # Direct POST (for Smithery scanner and direct clients)
+            (b"/mcp", "POST"): self._handle_direct_post,
+            (b"/messages", "POST"): self._handle_post_messages,
+            # Health check endpoint
+            (b"/", "GET"): _health,
+            (b"/", "HEAD"): _health_head,
+            (b"/health", "GET"): _health,
+            (b"/health", "HEAD"): _health_head,
+            # MCP configuration endpoint for Smithery discovery
+            (b"/.well-known/mcp-config", "GET"): _config,
+            (b"/.well-known/mcp-config", "HEAD"): _config_head,
+        }
+
+        # Known path with an unsupported method -> prebuilt 405 start message
+        # carrying the Allow header, mirroring Starlette's router (which also
+        # answers HEAD on its GET routes)
+        allowed_methods: dict[bytes, list[str]] = {}
+        for route_path, route_method in routes:
+            allowed_methods.setdefault(route_path, []).append(route_method)
+        method_not_allowed = {
+            route_path: _method_not_allowed_start(methods)
+            for route_path, methods in allowed_methods.items()
+        }
+
+        self._routes_get = routes.get
+        self._not_allowed_get = method_not_allowed.get
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        scope_type = scope["type"]
+        if scope_type == "http":
+            # raw_path is optional in the ASGI spec, so fall back to the decoded path
+            path = scope.get("raw_path") or scope["path"].encode()
+
+            handler = self._routes_get((path, scope["method"]))
+            if handler is not None:
+                await handler(scope, receive, send)
+                return
+            start = self._not_allowed_get(path)
+            if start is not None:
+                await send(start)
+                await send(_METHOD_NOT_ALLOWED_BODY)
+            else:
+                await _not_found(scope, receive, send)
+        elif scope_type == "lifespan":
+            # Handle lifespan events
+            logger.info("Handling lifespan event")
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    logger.info("Application startup")
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    logger.info("Application shutdown")
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+    async def _handle_mcp_sse(self, scope: dict, receive: Any, send: Any) -> None:
+        """Handle SSE connection for MCP"""
+        logger.debug("SSE connection opened")
+        async with self._sse_transport.connect_sse(scope, receive, send) as (read_stream, write_stream):
+            try:
+                await self._server.run(read_stream, write_stream, self._init_options)
+            except Exception as e:
+                # Log but don't crash - client might have disconnected
+                logger.error("Error in MCP session: %s", e)
+
+    async def _handle_post_messages(self, scope: dict, receive: Any, send: Any) -> None:
+        """Handle POST messages to /messages (with session)"""
+        logger.debug("Session message: %s", scope["query_string"])
+        await self._sse_transport.handle_post_message(scope, receive, send)
+
+    async def _handle_direct_post(self, scope: dict, receive: Any, send: Any) -> None:
+        """Handle direct POST to /mcp without session (for scanners)"""
+        req_id = None
+
+        try:
+            # Parse the JSON-RPC request
+            json_data = orjson.loads(await _read_body(receive))
+            logger.debug("Direct POST request: %s", json_data)
+            method = json_data.get("method")
+            req_id = json_data.get("id")
+            if isinstance(req_id, float) and not _ID_MIN < req_id < _ID_MAX:
+                body = _jsonrpc_error(
+                    None, -32600, "Invalid Request: numeric id must fit in 64 bits"
+                )
+                await _send_json(send, 400, body)
+                return
+
+            # Only a string can name a method; anything else (e.g. a list) is
+            # unhashable and falls through to method not found
+            if isinstance(method, str):
+                # Methods with a constant answer (initialize, ping and the listings)
+                result = self._static_results.get(method)
+                if result is not None:
+                    await _send_json(send, 200, _jsonrpc_result(req_id, result))
+                    return
+
+                # Notifications are not requests, so no response body is needed
+                # Just acknowledge with 202 Accepted
+                if method in _ACKNOWLEDGED_NOTIFICATIONS:
+                    await send(_ACCEPTED_START)
+                    await send(_EMPTY_BODY)
+                    return
+
+                # Handle tools/call request (execute a tool)
+                if method == "tools/call":
+                    params = json_data.get("params", {})
+                    tool_name = params.get("name")
+                    arguments = params.get("arguments", {})
+
+                    logger.info("Tool call: %s with args: %s", tool_name, arguments)
+
+                    try:
+                        handler = (
+                            TOOL_HANDLERS.get(tool_name) if isinstance(tool_name, str) else None
+                        )
+                        if handler is None:
+                            raise ValueError(f"Unknown tool: {tool_name}")
+
+                        result = handler(self._time_server, arguments)
+
+                        content = orjson.dumps(
+                            {"content": [{"type": "text", "text": result.model_dump_json()}]}
+                        )
+                        await _send_json(send, 200, _jsonrpc_result(req_id, content))
+                        return
+
+                    except Exception as e:
+                        logger.error("Error executing tool %s: %s", tool_name, e)
+                        body = _jsonrpc_error(req_id, -32603, f"Error executing tool: {str(e)}")
+                        await _send_json(send, 500, body)
+                        return
+
+            # Handle other methods
+            body = _jsonrpc_error(req_id, -32601, f"Method not found: {method}")
+            await _send_json(send, 400, body)
+
+        except Exception as e:
+            logger.error("Error handling direct POST: %s", e)
+            body = _jsonrpc_error(req_id, -32603, f"Internal error: {str(e)}")
+            await _send_json(send, 500, body)
+
+
+def create_app(
+    local_timezone: str | None = None,
+) -> Callable[[dict, Any, Any], Awaitable[None]]:
+    """Create the ASGI application"""
     
     server = Server("mcp-time")
     time_server = TimeServer()
     local_tz = str(get_local_tz(local_timezone))
 
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        """List available time tools."""
-        return [
-            Tool(
-                name=TimeTools.GET_CURRENT_TIME.value,
-                description="Get current time in a specific timezones",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "timezone": {
-                            "type": "string",
-                            "description": f"IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no timezone provided by the user.",
-                        }
-                    },
-                    "required": ["timezone"],
+    # The tool definitions only depend on local_tz, so build them once
+    tools = [
+        Tool(
+            name=TimeTools.GET_CURRENT_TIME.value,
+            description="Get current time in a specific timezones",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "timezone": {
+                        "type": "string",
+                        "description": f"IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no timezone provided by the user.",
+                    }
                 },
-            ),
-            Tool(
-                name=TimeTools.CONVERT_TIME.value,
-                description="Convert time between timezones",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "source_timezone": {
-                            "type": "string",
-                            "description": f"Source IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no source timezone provided by the user.",
-                        },
-                        "time": {
-                            "type": "string",
-                            "description": "Time to convert in 24-hour format (HH:MM)",
-                        },
-                        "target_timezone": {
-                            "type": "string",
-                            "description": f"Target IANA timezone name (e.g., 'Asia/Tokyo', 'America/San_Francisco'). Use '{local_tz}' as local timezone if no target timezone provided by the user.",
-                        },
+                "required": ["timezone"],
+            },
+        ),
+        Tool(
+            name=TimeTools.CONVERT_TIME.value,
+            description="Convert time between timezones",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "source_timezone": {
+                        "type": "string",
+                        "description": f"Source IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no source timezone provided by the user.",
+                    },
+                    "time": {
+                        "type": "string",
+                        "description": "Time to convert in 24-hour format (HH:MM)",
+                    },
+                    "target_timezone": {
+                        "type": "string",
+                        "description": f"Target IANA timezone name (e.g., 'Asia/Tokyo', 'America/San_Francisco'). Use '{local_tz}' as local timezone if no target timezone provided by the user.",
                     },
-                    "required": ["source_timezone", "time", "target_timezone"],
                 },
-            ),
-        ]
+                "required": ["source_timezone", "time", "target_timezone"],
+            },
+        ),
+    ]
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        """List available time tools."""
+        return tools
 
     @server.call_tool()
     async def call_tool(
@@ -71,397 +425,69 @@ def create_app(local_timezone: str | None = None) -> Starlette:
     ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """Handle tool calls for time queries."""
         try:
-            match name:
-                case TimeTools.GET_CURRENT_TIME.value:
-                    timezone = arguments.get("timezone")
-                    if not timezone:
-                        raise ValueError("Missing required argument: timezone")
-
-                    result = time_server.get_current_time(timezone)
-
-                case TimeTools.CONVERT_TIME.value:
-                    if not all(
-                        k in arguments
-                        for k in ["source_timezone", "time", "target_timezone"]
-                    ):
-                        raise ValueError("Missing required arguments")
-
-                    result = time_server.convert_time(
-                        arguments["source_timezone"],
-                        arguments["time"],
-                        arguments["target_timezone"],
-                    )
-                case _:
-                    raise ValueError(f"Unknown tool: {name}")
-
-            return [
-                TextContent(type="text", text=json.dumps(result.model_dump(), indent=2))
-            ]
+            handler = TOOL_HANDLERS.get(name)
+            if handler is None:
+                raise ValueError(f"Unknown tool: {name}")
+
+            result = handler(time_server, arguments)
 
+            return [TextContent(type="text", text=result.model_dump_json())]
+
+        except ValueError:
+            # Already a client-facing error, so keep the original message
+            raise
         except Exception as e:
-            raise ValueError(f"Error processing mcp-server-time query: {str(e)}")
+            raise ValueError(f"Error processing mcp-server-time query: {e}") from e
+
+    # The direct POST tools/list result is the same tool list, serialized once
+    # and spliced into every response
+    tools_list_bytes = orjson.dumps(
+        {"tools": [tool.model_dump(exclude_none=True) for tool in tools]}
+    )
+
+    # JSON-RPC method -> serialized result, for methods whose answer never changes
+    static_results = {
+        "initialize": _INITIALIZE_RESULT,
+        "ping": b"{}",
+        "prompts/list": b'{"prompts":[]}',
+        "resources/list": b'{"resources":[]}',
+        "tools/list": tools_list_bytes,
+    }
 
     # Create SSE transport
     # Using /messages as the message endpoint
     sse_transport = SseServerTransport("/messages")
-    
-    async def handle_mcp_sse(scope: dict, receive: Any, send: Any) -> None:
-        """Handle SSE connection for MCP"""
-        async with sse_transport.connect_sse(scope, receive, send) as (read_stream, write_stream):
-            init_options = server.create_initialization_options()
-            try:
-                await server.run(read_stream, write_stream, init_options)
-            except Exception as e:
-                # Log but don't crash - client might have disconnected
-                import logging
-                logging.error(f"Error in MCP session: {e}")
-    
-    async def handle_post_messages(scope: dict, receive: Any, send: Any) -> None:
-        """Handle POST messages to /messages (with session)"""
-        await sse_transport.handle_post_message(scope, receive, send)
-    
-    async def handle_direct_post(scope: dict, receive: Any, send: Any) -> None:
-        """Handle direct POST to /mcp without session (for scanners)"""
-        from starlette.requests import Request
-        from starlette.responses import JSONResponse
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        request = Request(scope, receive)
-        
-        try:
-            # Parse the JSON-RPC request
-            json_data = await request.json()
-            logger.info(f"Direct POST request: {json_data}")
-            
-            # Handle initialize request
-            if json_data.get("method") == "initialize":
-                response_data = {
-                    "jsonrpc": "2.0",
-                    "id": json_data.get("id"),
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {
-                            "experimental": {},
-                            "tools": {
-                                "listChanged": False
-                            }
-                        },
-                        "serverInfo": {
-                            "name": "mcp-time",
-                            "version": "1.0.0"
-                        }
-                    }
-                }
-                response = JSONResponse(response_data)
-                await response(scope, receive, send)
-                return
-            
-            # Handle notifications/initialized (notification, not a request)
-            elif json_data.get("method") == "notifications/initialized":
-                # This is a notification, not a request, so no response body needed
-                # Just acknowledge with 202 Accepted
-                from starlette.responses import Response
-                response = Response(status_code=202)
-                await response(scope, receive, send)
-                return
-            
-            # Handle notifications/cancelled (notification, not a request)
-            elif json_data.get("method") == "notifications/cancelled":
-                # Acknowledge cancellation notification
-                from starlette.responses import Response
-                response = Response(status_code=202)
-                await response(scope, receive, send)
-                return
-            
-            # Handle ping (heartbeat)
-            elif json_data.get("method") == "ping":
-                response_data = {
-                    "jsonrpc": "2.0",
-                    "id": json_data.get("id"),
-                    "result": {}
-                }
-                response = JSONResponse(response_data)
-                await response(scope, receive, send)
-                return
-            
-            # Handle prompts/list (return empty list)
-            elif json_data.get("method") == "prompts/list":
-                response_data = {
-                    "jsonrpc": "2.0",
-                    "id": json_data.get("id"),
-                    "result": {
-                        "prompts": []
-                    }
-                }
-                response = JSONResponse(response_data)
-                await response(scope, receive, send)
-                return
-            
-            # Handle resources/list (return empty list)
-            elif json_data.get("method") == "resources/list":
-                response_data = {
-                    "jsonrpc": "2.0",
-                    "id": json_data.get("id"),
-                    "result": {
-                        "resources": []
-                    }
-                }
-                response = JSONResponse(response_data)
-                await response(scope, receive, send)
-                return
-            
-            # Handle tools/list request
-            elif json_data.get("method") == "tools/list":
-                # Return the tools list manually since we know what they are
-                tools_list = [
-                    {
-                        "name": "get_current_time",
-                        "description": "Get current time in a specific timezones",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "timezone": {
-                                    "type": "string",
-                                    "description": f"IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no timezone provided by the user."
-                                }
-                            },
-                            "required": ["timezone"]
-                        }
-                    },
-                    {
-                        "name": "convert_time",
-                        "description": "Convert time between timezones",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "source_timezone": {
-                                    "type": "string",
-                                    "description": f"Source IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no source timezone provided by the user."
-                                },
-                                "time": {
-                                    "type": "string",
-                                    "description": "Time to convert in 24-hour format (HH:MM)"
-                                },
-                                "target_timezone": {
-                                    "type": "string",
-                                    "description": f"Target IANA timezone name (e.g., 'Asia/Tokyo', 'America/San_Francisco'). Use '{local_tz}' as local timezone if no target timezone provided by the user."
-                                }
-                            },
-                            "required": ["source_timezone", "time", "target_timezone"]
-                        }
-                    }
-                ]
-                response_data = {
-                    "jsonrpc": "2.0",
-                    "id": json_data.get("id"),
-                    "result": {
-                        "tools": tools_list
-                    }
-                }
-                response = JSONResponse(response_data)
-                await response(scope, receive, send)
-                return
-            
-            # Handle tools/call request (execute a tool)
-            elif json_data.get("method") == "tools/call":
-                params = json_data.get("params", {})
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-                
-                logger.info(f"Tool call: {tool_name} with args: {arguments}")
-                
-                try:
-                    if tool_name == "get_current_time":
-                        timezone = arguments.get("timezone")
-                        if not timezone:
-                            raise ValueError("Missing required argument: timezone")
-                        
-                        result = time_server.get_current_time(timezone)
-                        
-                        response_data = {
-                            "jsonrpc": "2.0",
-                            "id": json_data.get("id"),
-                            "result": {
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": json.dumps(result.model_dump(), indent=2)
-                                    }
-                                ]
-                            }
-                        }
-                        
-                    elif tool_name == "convert_time":
-                        source_timezone = arguments.get("source_timezone")
-                        time_str = arguments.get("time")
-                        target_timezone = arguments.get("target_timezone")
-                        
-                        if not all([source_timezone, time_str, target_timezone]):
-                            raise ValueError("Missing required arguments")
-                        
-                        result = time_server.convert_time(source_timezone, time_str, target_timezone)
-                        
-                        response_data = {
-                            "jsonrpc": "2.0",
-                            "id": json_data.get("id"),
-                            "result": {
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": json.dumps(result.model_dump(), indent=2)
-                                    }
-                                ]
-                            }
-                        }
-                    else:
-                        raise ValueError(f"Unknown tool: {tool_name}")
-                    
-                    response = JSONResponse(response_data)
-                    await response(scope, receive, send)
-                    return
-                    
-                except Exception as e:
-                    logger.error(f"Error executing tool {tool_name}: {e}")
-                    response_data = {
-                        "jsonrpc": "2.0",
-                        "id": json_data.get("id"),
-                        "error": {
-                            "code": -32603,
-                            "message": f"Error executing tool: {str(e)}"
-                        }
-                    }
-                    response = JSONResponse(response_data, status_code=500)
-                    await response(scope, receive, send)
-                    return
-            
-            # Handle other methods
-            else:
-                response_data = {
-                    "jsonrpc": "2.0",
-                    "id": json_data.get("id"),
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {json_data.get('method')}"
-                    }
-                }
-                response = JSONResponse(response_data, status_code=400)
-                await response(scope, receive, send)
-                return
-                
-        except Exception as e:
-            logger.error(f"Error handling direct POST: {e}")
-            response_data = {
-                "jsonrpc": "2.0",
-                "id": json_data.get("id") if 'json_data' in locals() else None,
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }
-            response = JSONResponse(response_data, status_code=500)
-            await response(scope, receive, send)
-
-    # Create a simple ASGI app that routes requests
-    async def app(scope: dict, receive: Any, send: Any) -> None:
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        if scope["type"] == "http":
-            path = scope["path"]
-            method = scope["method"]
-            
-            logger.info(f"HTTP request: {method} {path}")
-            
-            if path == "/mcp":
-                if method == "GET":
-                    # SSE connection
-                    await handle_mcp_sse(scope, receive, send)
-                elif method == "POST":
-                    # Direct POST (for Smithery scanner and direct clients)
-                    await handle_direct_post(scope, receive, send)
-            elif path == "/messages" and method == "POST":
-                await handle_post_messages(scope, receive, send)
-            elif path == "/" or path == "/health":
-                # Health check endpoint
-                await send({
-                    "type": "http.response.start",
-                    "status": 200,
-                    "headers": [
-                        [b"content-type", b"application/json"],
-                        [b"cache-control", b"no-cache"],
-                    ],
-                })
-                await send({
-                    "type": "http.response.body",
-                    "body": json.dumps({
-                        "status": "ok",
-                        "server": "mcp-time",
-                        "version": "0.6.2",
-                        "mcp_endpoint": "/mcp"
-                    }).encode(),
-                })
-            elif path == "/.well-known/mcp-config":
-                # MCP configuration endpoint for Smithery discovery
-                await send({
-                    "type": "http.response.start",
-                    "status": 200,
-                    "headers": [
-                        [b"content-type", b"application/json"],
-                        [b"cache-control", b"no-cache"],
-                    ],
-                })
-                await send({
-                    "type": "http.response.body",
-                    "body": json.dumps({
-                        "$schema": "http://json-schema.org/draft-07/schema#",
-                        "$id": "https://mcp-time/.well-known/mcp-config",
-                        "title": "MCP Time Server Configuration",
-                        "description": "Configuration for MCP Time Server (no configuration required)",
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False
-                    }).encode(),
-                })
-            else:
-                # 404 Not Found
-                await send({
-                    "type": "http.response.start",
-                    "status": 404,
-                    "headers": [[b"content-type", b"text/plain"]],
-                })
-                await send({
-                    "type": "http.response.body",
-                    "body": b"Not Found",
-                })
-        elif scope["type"] == "lifespan":
-            # Handle lifespan events
-            logger.info("Handling lifespan event")
-            while True:
-                message = await receive()
-                if message["type"] == "lifespan.startup":
-                    logger.info("Application startup")
-                    await send({"type": "lifespan.startup.complete"})
-                elif message["type"] == "lifespan.shutdown":
-                    logger.info("Application shutdown")
-                    await send({"type": "lifespan.shutdown.complete"})
-                    return
-    
-    return app
+    # The options are identical for every session, so build them once
+    init_options = server.create_initialization_options()
 
+    return _TimeApp(server, init_options, sse_transport, time_server, static_results)
+
+
+# Environment variable carrying --local-timezone into worker processes
+_LOCAL_TIMEZONE_ENV = "MCP_TIME_LOCAL_TIMEZONE"
 
-def main():
-    """Run the HTTP server"""
-    import argparse
-    import uvicorn
-    import logging
 
-    # Configure logging
+def _configure_logging() -> None:
+    """Configure the root logger for the server process"""
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    logger = logging.getLogger(__name__)
+
+
+def _create_app_from_env() -> Any:
+    """App factory used by uvicorn worker processes"""
+    # Workers are fresh processes, so main()'s logging setup does not carry over
+    _configure_logging()
+    return create_app(os.environ.get(_LOCAL_TIMEZONE_ENV))
+
+
+def main():
+    """Run the HTTP server"""
+    import argparse
+    import uvicorn
+
+    _configure_logging()
 
     parser = argparse.ArgumentParser(
         description="MCP Time Server - HTTP/SSE version"
@@ -469,6 +495,28 @@ def main():
     parser.add_argument("--local-timezone", type=str, help="Override local timezone")
     parser.add_argument("--port", type=int, default=8000, help="Port to run server on")
     parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to bind to")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes. SSE sessions live in the worker that "
+        "opened them, so only use more than one for direct POST /mcp traffic "
+        "or behind a load balancer with sticky sessions",
+    )
+    # Prefer uvloop and httptools, falling back to the pure-Python
+    # implementations where they are not installed (e.g. uvloop on Windows)
+    parser.add_argument(
+        "--loop",
+        choices=["asyncio", "uvloop"],
+        default="uvloop" if find_spec("uvloop") else "asyncio",
+        help="Event loop implementation",
+    )
+    parser.add_argument(
+        "--http",
+        choices=["h11", "httptools"],
+        default="httptools" if find_spec("httptools") else "h11",
+        help="HTTP protocol implementation",
+    )
 
     args = parser.parse_args()
     
@@ -479,14 +527,30 @@ def main():
     logger.info(f"Local timezone: {args.local_timezone or 'auto-detect'}")
     logger.info(f"MCP endpoint: http://{args.host}:{port}/mcp")
     
-    app = create_app(args.local_timezone)
+    if args.workers > 1:
+        # Worker processes build their own app from an import string, so pass
+        # the timezone override through the environment they inherit. Only
+        # --local-timezone sets it, as with a single worker
+        if args.local_timezone:
+            os.environ[_LOCAL_TIMEZONE_ENV] = args.local_timezone
+        else:
+            os.environ.pop(_LOCAL_TIMEZONE_ENV, None)
+        app = "mcp_server_time.http_server:_create_app_from_env"
+    else:
+        app = create_app(args.local_timezone)
     
     uvicorn.run(
         app, 
         host=args.host, 
         port=port,
+        workers=args.workers,
+        factory=args.workers > 1,
         log_level="info",
-        access_log=True
+        loop=args.loop,
+        http=args.http,
+        lifespan="on",
+        access_log=False,
+        proxy_headers=False
     )
 
 
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from enum import Enum
-import json
-from typing import Sequence
+from functools import lru_cache
+from typing import Callable, Sequence
 
 from zoneinfo import ZoneInfo
 from tzlocal import get_localzone_name  # ← returns "Europe/Paris", etc.
@@ -38,21 +38,28 @@ class TimeConversionInput(BaseModel):
     target_tz_list: list[str]
 
 
+# ZoneInfo already caches instances per key; this LRU only keeps strong
+# references so recently used zones are never evicted from the stdlib cache
+@lru_cache(maxsize=512)
+def _cached_zoneinfo(timezone_name: str) -> ZoneInfo:
+    return ZoneInfo(timezone_name)
+
+
 def get_local_tz(local_tz_override: str | None = None) -> ZoneInfo:
     if local_tz_override:
-        return ZoneInfo(local_tz_override)
+        return _cached_zoneinfo(local_tz_override)
 
     # Get local timezone from datetime.now()
     local_tzname = get_localzone_name()
     if local_tzname is not None:
-        return ZoneInfo(local_tzname)
+        return _cached_zoneinfo(local_tzname)
     # Default to UTC if local timezone cannot be determined
-    return ZoneInfo("UTC")
+    return _cached_zoneinfo("UTC")
 
 
 def get_zoneinfo(timezone_name: str) -> ZoneInfo:
     try:
-        return ZoneInfo(timezone_name)
+        return _cached_zoneinfo(timezone_name)
     except Exception as e:
         raise McpError(f"Invalid timezone: {str(e)}")
 
@@ -120,52 +127,82 @@ class TimeServer:
         )
 
 
+def _do_current(time_server: TimeServer, arguments: dict) -> TimeResult:
+    """Run get_current_time with validated arguments"""
+    timezone = arguments.get("timezone")
+    if not timezone:
+        raise ValueError("Missing required argument: timezone")
+
+    return time_server.get_current_time(timezone)
+
+
+def _do_convert(time_server: TimeServer, arguments: dict) -> TimeConversionResult:
+    """Run convert_time with validated arguments"""
+    source_timezone = arguments.get("source_timezone")
+    time = arguments.get("time")
+    target_timezone = arguments.get("target_timezone")
+    if not (source_timezone and time and target_timezone):
+        raise ValueError("Missing required arguments")
+
+    return time_server.convert_time(source_timezone, time, target_timezone)
+
+
+# Tool name -> handler, looked up once per call instead of matching enum values
+TOOL_HANDLERS: dict[str, Callable[[TimeServer, dict], BaseModel]] = {
+    TimeTools.GET_CURRENT_TIME.value: _do_current,
+    TimeTools.CONVERT_TIME.value: _do_convert,
+}
+
+
 async def serve(local_timezone: str | None = None) -> None:
     server = Server("mcp-time")
     time_server = TimeServer()
     local_tz = str(get_local_tz(local_timezone))
 
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        """List available time tools."""
-        return [
-            Tool(
-                name=TimeTools.GET_CURRENT_TIME.value,
-                description="Get current time in a specific timezones",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "timezone": {
-                            "type": "string",
-                            "description": f"IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no timezone provided by the user.",
-                        }
-                    },
-                    "required": ["timezone"],
+    # The tool definitions only depend on local_tz, so build them once
+    tools = [
+        Tool(
+            name=TimeTools.GET_CURRENT_TIME.value,
+            description="Get current time in a specific timezones",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "timezone": {
+                        "type": "string",
+                        "description": f"IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no timezone provided by the user.",
+                    }
                 },
-            ),
-            Tool(
-                name=TimeTools.CONVERT_TIME.value,
-                description="Convert time between timezones",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "source_timezone": {
-                            "type": "string",
-                            "description": f"Source IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no source timezone provided by the user.",
-                        },
-                        "time": {
-                            "type": "string",
-                            "description": "Time to convert in 24-hour format (HH:MM)",
-                        },
-                        "target_timezone": {
-                            "type": "string",
-                            "description": f"Target IANA timezone name (e.g., 'Asia/Tokyo', 'America/San_Francisco'). Use '{local_tz}' as local timezone if no target timezone provided by the user.",
-                        },
+                "required": ["timezone"],
+            },
+        ),
+        Tool(
+            name=TimeTools.CONVERT_TIME.value,
+            description="Convert time between timezones",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "source_timezone": {
+                        "type": "string",
+                        "description": f"Source IANA timezone name (e.g., 'America/New_York', 'Europe/London'). Use '{local_tz}' as local timezone if no source timezone provided by the user.",
+                    },
+                    "time": {
+                        "type": "string",
+                        "description": "Time to convert in 24-hour format (HH:MM)",
+                    },
+                    "target_timezone": {
+                        "type": "string",
+                        "description": f"Target IANA timezone name (e.g., 'Asia/Tokyo', 'America/San_Francisco'). Use '{local_tz}' as local timezone if no target timezone provided by the user.",
                     },
-                    "required": ["source_timezone", "time", "target_timezone"],
                 },
-            ),
-        ]
+                "required": ["source_timezone", "time", "target_timezone"],
+            },
+        ),
+    ]
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        """List available time tools."""
+        return tools
 
     @server.call_tool()
     async def call_tool(
@@ -173,35 +210,19 @@ async def serve(local_timezone: str | None = None) -> None:
     ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """Handle tool calls for time queries."""
         try:
-            match name:
-                case TimeTools.GET_CURRENT_TIME.value:
-                    timezone = arguments.get("timezone")
-                    if not timezone:
-                        raise ValueError("Missing required argument: timezone")
-
-                    result = time_server.get_current_time(timezone)
-
-                case TimeTools.CONVERT_TIME.value:
-                    if not all(
-                        k in arguments
-                        for k in ["source_timezone", "time", "target_timezone"]
-                    ):
-                        raise ValueError("Missing required arguments")
-
-                    result = time_server.convert_time(
-                        arguments["source_timezone"],
-                        arguments["time"],
-                        arguments["target_timezone"],
-                    )
-                case _:
-                    raise ValueError(f"Unknown tool: {name}")
-
-            return [
-                TextContent(type="text", text=json.dumps(result.model_dump(), indent=2))
-            ]
+            handler = TOOL_HANDLERS.get(name)
+            if handler is None:
+                raise ValueError(f"Unknown tool: {name}")
 
+            result = handler(time_server, arguments)
+
+            return [TextContent(type="text", text=result.model_dump_json())]
+
+        except ValueError:
+            # Already a client-facing error, so keep the original message
+            raise
         except Exception as e:
-            raise ValueError(f"Error processing mcp-server-time query: {str(e)}")
+            raise ValueError(f"Error processing mcp-server-time query: {e}") from e
 
     options = server.create_initialization_options()
     async with stdio_server() as (read_stream, write_stream):
@@ -1,11 +1,21 @@
 
+import asyncio
+import json
+
 from freezegun import freeze_time
 from mcp.shared.exceptions import McpError
 import pytest
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
-from mcp_server_time.server import TimeServer, get_local_tz
+from mcp_server_time.http_server import create_app
+from mcp_server_time.server import (
+    TOOL_HANDLERS,
+    TimeServer,
+    _cached_zoneinfo,
+    get_local_tz,
+    get_zoneinfo,
+)
 
 
 @pytest.mark.parametrize(
@@ -526,3 +536,263 @@ def test_get_local_tz_various_timezones(mock_get_localzone, timezone_name):
     result = get_local_tz()
     assert str(result) == timezone_name
     assert isinstance(result, ZoneInfo)
+
+
+def test_get_zoneinfo_is_memoized():
+    """Test that repeated lookups of a timezone reuse the cached ZoneInfo."""
+    _cached_zoneinfo.cache_clear()
+    with patch('mcp_server_time.server.ZoneInfo', wraps=ZoneInfo) as mock_zoneinfo:
+        first = get_zoneinfo("Asia/Kathmandu")
+        second = get_zoneinfo("Asia/Kathmandu")
+    assert first is second
+    mock_zoneinfo.assert_called_once_with("Asia/Kathmandu")
+
+
+def test_get_zoneinfo_does_not_cache_invalid_timezones():
+    """Test that invalid timezone names keep raising on every lookup."""
+    _cached_zoneinfo.cache_clear()
+    for _ in range(2):
+        with pytest.raises(McpError, match=r"Invalid timezone"):
+            get_zoneinfo("Invalid/Timezone")
+    assert _cached_zoneinfo.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize(
+    "tool_name,arguments,expected_error",
+    [
+        ("get_current_time", {}, "Missing required argument: timezone"),
+        ("get_current_time", {"timezone": None}, "Missing required argument: timezone"),
+        ("convert_time", {"source_timezone": "UTC", "time": "12:00"}, "Missing required arguments"),
+        (
+            "convert_time",
+            {"source_timezone": "UTC", "time": "12:00", "target_timezone": None},
+            "Missing required arguments",
+        ),
+        (
+            "convert_time",
+            {"source_timezone": "", "time": "12:00", "target_timezone": "UTC"},
+            "Missing required arguments",
+        ),
+    ],
+)
+def test_tool_handlers_validate_arguments(tool_name, arguments, expected_error):
+    """Test that tool handlers reject calls with missing arguments."""
+    with pytest.raises(ValueError, match=expected_error):
+        TOOL_HANDLERS[tool_name](TimeServer(), arguments)
+
+
+@freeze_time("2024-01-01 12:00:00+00:00")
+def test_tool_handlers_dispatch_to_time_server():
+    """Test that tool handlers pass their arguments through to TimeServer."""
+    result = TOOL_HANDLERS["convert_time"](
+        TimeServer(),
+        {"source_timezone": "UTC", "time": "12:00", "target_timezone": "Asia/Tokyo"},
+    )
+    assert result.target.datetime == "2024-01-01T21:00:00+09:00"
+    assert result.time_difference == "+9.0h"
+
+
+def _asgi_request(method, path, body=b"", chunks=None, raw_path=True):
+    """Run one HTTP request through the ASGI app and collect the response."""
+    if chunks is None:
+        chunks = [body]
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": [],
+    }
+    if raw_path:
+        scope["raw_path"] = path.encode()
+    asyncio.run(create_app("UTC")(scope, receive, send))
+
+    start, *body_messages = sent
+    headers = {bytes(k).decode(): bytes(v).decode() for k, v in start["headers"]}
+    return start["status"], headers, b"".join(m["body"] for m in body_messages)
+
+
+def _jsonrpc_request(method, req_id=1, **params):
+    request = {"jsonrpc": "2.0", "id": req_id, "method": method}
+    if params:
+        request["params"] = params
+    return _asgi_request("POST", "/mcp", json.dumps(request).encode())
+
+
+def test_direct_post_malformed_body():
+    """Test an unparseable body is reported as an internal error."""
+    status, _, body = _asgi_request("POST", "/mcp", b"{not json")
+    assert status == 500
+    response = json.loads(body)
+    assert response["id"] is None
+    assert response["error"]["code"] == -32603
+
+
+def test_direct_post_echoes_64_bit_ids():
+    """Test ids at the edges of the 64-bit range are echoed exactly."""
+    for req_id in (2**64 - 1, -(2**63)):
+        status, _, body = _jsonrpc_request("ping", req_id=req_id)
+        assert status == 200
+        assert json.loads(body)["id"] == req_id
+
+
+@pytest.mark.parametrize("req_id", [2**64, -(2**63) - 1, 123456789012345678901234567890])
+def test_direct_post_rejects_ids_beyond_64_bits(req_id):
+    """Test ids that cannot be parsed exactly are rejected, not altered."""
+    status, _, body = _jsonrpc_request("ping", req_id=req_id)
+    assert status == 400
+    response = json.loads(body)
+    assert response["id"] is None
+    assert response["error"]["code"] == -32600
+
+
+@pytest.mark.parametrize("path", ["/", "/health"])
+def test_http_health(path):
+    """Test the health endpoints answer GET and HEAD."""
+    status, headers, body = _asgi_request("GET", path)
+    assert status == 200
+    assert headers["content-type"] == "application/json"
+    assert headers["content-length"] == str(len(body))
+    assert json.loads(body)["status"] == "ok"
+
+    status, head_headers, body = _asgi_request("HEAD", path)
+    assert status == 200
+    assert head_headers == headers
+    assert body == b""
+
+
+def test_http_config():
+    """Test the MCP configuration endpoint."""
+    status, headers, body = _asgi_request("GET", "/.well-known/mcp-config")
+    assert status == 200
+    assert headers["content-length"] == str(len(body))
+    assert json.loads(body)["title"] == "MCP Time Server Configuration"
+
+
+def test_direct_post_chunked_body():
+    """Test a request body split across several receive messages."""
+    request = b'{"jsonrpc":"2.0","id":5,"method":"ping"}'
+    status, _, body = _asgi_request("POST", "/mcp", chunks=[request[:10], request[10:]])
+    assert status == 200
+    assert json.loads(body) == {"jsonrpc": "2.0", "id": 5, "result": {}}
+
+
+def test_direct_post_notification():
+    """Test notifications are acknowledged with an empty 202."""
+    status, headers, body = _jsonrpc_request("notifications/initialized")
+    assert status == 202
+    assert headers["content-length"] == "0"
+    assert body == b""
+
+
+@pytest.mark.parametrize("raw_path", [True, False])
+def test_http_not_found(raw_path):
+    """Test unknown paths get a 404, with or without raw_path in the scope."""
+    status, headers, body = _asgi_request("GET", "/nope", raw_path=raw_path)
+    assert status == 404
+    assert headers["content-length"] == "9"
+    assert body == b"Not Found"
+
+
+def test_direct_post_initialize():
+    """Test direct POST initialize echoes the request id."""
+    status, headers, body = _jsonrpc_request("initialize", req_id="abc")
+    assert status == 200
+    assert headers["content-length"] == str(len(body))
+    response = json.loads(body)
+    assert response["jsonrpc"] == "2.0"
+    assert response["id"] == "abc"
+    assert response["result"]["protocolVersion"] == "2024-11-05"
+    assert response["result"]["serverInfo"]["name"] == "mcp-time"
+
+
+def test_direct_post_tools_list():
+    """Test direct POST tools/list returns both tools."""
+    status, _, body = _jsonrpc_request("tools/list", req_id=3)
+    assert status == 200
+    response = json.loads(body)
+    assert response["id"] == 3
+    assert [tool["name"] for tool in response["result"]["tools"]] == [
+        "get_current_time",
+        "convert_time",
+    ]
+
+
+def test_http_routes_without_raw_path():
+    """Test routing falls back to the decoded path when raw_path is absent."""
+    status, _, body = _asgi_request("GET", "/health", raw_path=False)
+    assert status == 200
+    assert json.loads(body)["status"] == "ok"
+
+
+@pytest.mark.parametrize(
+    "method,path,allow",
+    [
+        ("POST", "/health", "GET, HEAD"),
+        ("DELETE", "/mcp", "GET, POST"),
+        ("GET", "/messages", "POST"),
+    ],
+)
+def test_http_method_not_allowed(method, path, allow):
+    """Test known paths reject other methods with 405 and an Allow header."""
+    status, headers, body = _asgi_request(method, path)
+    assert status == 405
+    assert headers["allow"] == allow
+    assert body == b"Method Not Allowed"
+
+
+@pytest.mark.parametrize("method", ["what/ever", ["tools/list"], {"a": 1}, None])
+def test_direct_post_unknown_method(method):
+    """Test unknown or non-string methods get Method not found."""
+    status, _, body = _jsonrpc_request(method, req_id=9)
+    assert status == 400
+    response = json.loads(body)
+    assert response["id"] == 9
+    assert response["error"]["code"] == -32601
+
+
+@pytest.mark.parametrize(
+    "params,expected_error",
+    [
+        ({"name": "bogus", "arguments": {}}, "Unknown tool: bogus"),
+        ({"name": ["get_current_time"], "arguments": {}}, "Unknown tool"),
+        ({"name": "get_current_time", "arguments": {"timezone": "Bad/Zone"}}, "Invalid timezone"),
+        (
+            {"name": "convert_time", "arguments": {"source_timezone": "UTC", "time": "12:00", "target_timezone": None}},
+            "Missing required arguments",
+        ),
+    ],
+)
+def test_direct_post_tools_call_errors(params, expected_error):
+    """Test direct POST tool failures are reported as JSON-RPC errors."""
+    status, _, body = _jsonrpc_request("tools/call", **params)
+    assert status == 500
+    error = json.loads(body)["error"]
+    assert error["code"] == -32603
+    assert expected_error in error["message"]
+
+
+@freeze_time("2024-01-01 12:00:00+00:00")
+def test_direct_post_tools_call():
+    """Test direct POST tools/call returns the tool result as text content."""
+    status, _, body = _jsonrpc_request(
+        "tools/call",
+        name="convert_time",
+        arguments={"source_timezone": "UTC", "time": "12:00", "target_timezone": "Asia/Tokyo"},
+    )
+    assert status == 200
+    content = json.loads(body)["result"]["content"]
+    assert content[0]["type"] == "text"
+    assert json.loads(content[0]["text"])["target"]["datetime"] == "2024-01-01T21:00:00+09:00"